@@ -35,7 +35,7 @@ class AMLGenerator:
 
         # Render relationships
         lines.append("// Relationships")
-        relationships = self._collect_relationships(classes)
+        relationships = self.collect_relationships(classes)
         for rel in sorted(relationships):
             lines.append(rel)
             
@@ -62,7 +62,8 @@ class AMLGenerator:
         lines.append(f"{indent}}}")
         return lines
 
-    def _collect_relationships(self, classes: List[ClassModel]) -> List[str]:
+    def collect_relationships(self, classes: List[ClassModel]) -> List[str]:
+        """Returns the AML relationship lines declared by the given classes (unsorted)."""
         rel_lines = []
         for cls in classes:
             full_name = self._get_full_name(cls)
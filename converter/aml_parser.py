@@ -0,0 +1,293 @@
+import io
+import re
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from .base import BaseParser
+from .models import ClassModel, FieldModel, MethodModel, RelationshipModel
+
+# AML arrows (AML_SPEC.md, section 2) and the relationship kinds they stand for
+ARROWS = {
+    "--|>": "extends",
+    "..|>": "implements",
+    "->": "association",
+    "o--": "aggregation",
+    "*--": "composition",
+    "..>": "dependency",
+}
+
+_NAMESPACE_RE = re.compile(r"^namespace\s+([\w.$]+)\s*\{$")
+_CLASS_RE = re.compile(r"^(abstract\s+)?(\w+)\s+([\w$]+)\s*\{\s*(\})?$")
+_RELATION_RE = re.compile(
+    r"^(\S+)\s+(" + "|".join(re.escape(a) for a in ARROWS) + r")\s+(\S+)\s*(?:\[(.*)\])?$"
+)
+_SUFFIX_RE = re.compile(r"^(?P<body>.*?)(?:\s*\[(?P<vis>[+\-#~])\])?(?P<static>\s+static)?$")
+_QUALIFIED_RE = re.compile(r"^[\w$]+(\.[\w$]+)+$")
+
+
+class AMLTokenizer:
+    """
+    Hand-written streaming tokenizer for AML. Reads the source one line at a time,
+    strips `//` and `/* */` comments (outside of quoted strings) and emits one
+    (line number, kind, value, text) token per logical line, where kind is one of
+    namespace, class, member, end or relation.
+    """
+
+    def __init__(self, stream: Iterable[str]):
+        self._stream = stream
+        self._in_comment = False
+
+    def _strip_comments(self, line: str) -> str:
+        out = []
+        i, n = 0, len(line)
+        quote = None
+        while i < n:
+            ch = line[i]
+            if self._in_comment:
+                if line.startswith("*/", i):
+                    self._in_comment = False
+                    i += 2
+                else:
+                    i += 1
+                continue
+            if quote:
+                if ch == quote:
+                    quote = None
+            elif ch in "\"'":
+                quote = ch
+            elif line.startswith("//", i):
+                break
+            elif line.startswith("/*", i):
+                self._in_comment = True
+                i += 2
+                continue
+            out.append(ch)
+            i += 1
+        return "".join(out).strip()
+
+    def __iter__(self) -> Iterator[Tuple[int, str, object, str]]:
+        for line_no, raw in enumerate(self._stream, start=1):
+            line = self._strip_comments(raw)
+            if not line:
+                continue
+            if line == "}":
+                yield line_no, "end", None, line
+            elif m := _NAMESPACE_RE.match(line):
+                yield line_no, "namespace", m.group(1), line
+            elif m := _CLASS_RE.match(line):
+                yield line_no, "class", (bool(m.group(1)), m.group(2), m.group(3)), line
+                if m.group(4):
+                    yield line_no, "end", None, line
+            elif m := _RELATION_RE.match(line):
+                yield line_no, "relation", (m.group(1), m.group(2), m.group(3), m.group(4)), line
+            else:
+                yield line_no, "member", line, line
+
+
+class AMLParser(BaseParser):
+    """
+    Reads Aetheris Modeling Language back into ClassModel objects.
+    `iter_events` streams classes and relationships with memory bounded by the
+    current class; `parse`/`read`/`read_files` collect them into a full model.
+    Relationships whose source class is not declared in the input are kept in
+    `unresolved` instead of being attached.
+    """
+
+    def __init__(self):
+        self.unresolved: List[RelationshipModel] = []
+
+    @property
+    def supported_extensions(self) -> List[str]:
+        return [".aml"]
+
+    def parse(self, content: str) -> List[ClassModel]:
+        return self.read(io.StringIO(content))
+
+    def read_file(self, path: Union[str, Path]) -> List[ClassModel]:
+        return self.read_files([path])
+
+    def read(self, stream: Iterable[str]) -> List[ClassModel]:
+        """Builds the model, attaching every relationship to its source class."""
+        return self._attach(list(self._collect(stream, 0)))
+
+    def read_files(self, paths: Iterable[Union[str, Path]]) -> List[ClassModel]:
+        """
+        Reads several AML files as one model, e.g. the shards and index written by
+        --shard-by. Relationships are attached once all files are read, so they may
+        refer to classes declared in another file.
+
+        Raises:
+            ValueError: On malformed AML or a class declared more than once.
+        """
+        events = []
+        for file_id, path in enumerate(paths):
+            with open(path, "r", encoding="utf-8") as f:
+                try:
+                    events.extend(self._collect(f, file_id))
+                except ValueError as e:
+                    raise ValueError(f"{path}: {e}") from None
+        return self._attach(events)
+
+    def _collect(self, stream: Iterable[str], file_id: int) -> Iterator[Tuple[int, Union[ClassModel, RelationshipModel]]]:
+        for event in self.iter_events(stream):
+            yield file_id, event
+
+    def iter_events(self, stream: Iterable[str]) -> Iterator[Union[ClassModel, RelationshipModel]]:
+        """
+        Yields each ClassModel as soon as its block closes and each RelationshipModel
+        as soon as it is read. Only the namespace stack and the open class are kept.
+
+        Raises:
+            ValueError: On malformed AML, with the offending line number.
+        """
+        namespaces: List[str] = []
+        scopes: List[str] = []  # "namespace" or "class" for every open block
+        current: Optional[ClassModel] = None
+
+        for line_no, kind, value, text in AMLTokenizer(stream):
+            if kind == "namespace":
+                if current:
+                    raise ValueError(f"line {line_no}: namespace inside class {current.name}")
+                namespaces.append(value)
+                scopes.append("namespace")
+            elif kind == "class":
+                if current:
+                    raise ValueError(f"line {line_no}: nested class inside {current.name}")
+                is_abstract, class_type, name = value
+                current = ClassModel(
+                    name=name,
+                    type=class_type,
+                    visibility=None,  # AML does not record class visibility
+                    is_abstract=is_abstract,
+                    package=".".join(namespaces) or None,
+                )
+                scopes.append("class")
+            elif kind == "end":
+                if not scopes:
+                    raise ValueError(f"line {line_no}: unmatched '}}'")
+                if scopes.pop() == "class":
+                    yield current
+                    current = None
+                else:
+                    namespaces.pop()
+            elif current is not None:
+                # Inside a class block every other line is a member, even if it looks like an arrow
+                self._parse_member(current, text)
+            elif kind == "relation":
+                yield self._parse_relation(*value)
+            else:
+                raise ValueError(f"line {line_no}: unexpected '{text}'")
+
+        if scopes:
+            raise ValueError(f"unexpected end of input: {len(scopes)} unclosed block(s)")
+
+    def _parse_member(self, cls: ClassModel, text: str):
+        m = _SUFFIX_RE.match(text)
+        body, vis, static = m.group("body").strip(), m.group("vis"), bool(m.group("static"))
+        visibility = vis if vis is not None else "+"
+
+        paren = body.find("(")
+        colon = body.find(":")
+        if paren != -1 and (colon == -1 or paren < colon):
+            # Method: name(params): returnType
+            close = self._matching_paren(body, paren)
+            params = self._split_params(body[paren + 1:close])
+            rest = body[close + 1:].strip()
+            return_type = rest[1:].strip() if rest.startswith(":") else "void"
+            cls.methods.append(MethodModel(body[:paren].strip(), return_type, params, visibility, static))
+        elif colon != -1:
+            # Field: name: type
+            field_type = body[colon + 1:].strip()
+            if cls.type == "enum" and not field_type:
+                # Enum constants are written as `ADMIN:  [+]` but carry no visibility in the model
+                visibility = ""
+            cls.fields.append(FieldModel(body[:colon].strip(), field_type, visibility, static))
+        else:
+            # Enum constants: ADMIN, USER, GUEST
+            for constant in self._split_params(body):
+                cls.fields.append(FieldModel(constant, "", "", False))
+
+    def _matching_paren(self, text: str, start: int) -> int:
+        depth = 0
+        for i in range(start, len(text)):
+            if text[i] == "(":
+                depth += 1
+            elif text[i] == ")":
+                depth -= 1
+                if depth == 0:
+                    return i
+        return len(text)
+
+    def _split_params(self, text: str) -> List[str]:
+        """Splits on top-level commas so generic arguments like Map<K, V> stay intact."""
+        params, depth, start = [], 0, 0
+        for i, ch in enumerate(text):
+            if ch in "<([":
+                depth += 1
+            elif ch in ">)]":
+                depth -= 1
+            elif ch == "," and depth == 0:
+                params.append(text[start:i].strip())
+                start = i + 1
+        last = text[start:].strip()
+        if last:
+            params.append(last)
+        return params
+
+    def _parse_relation(self, source: str, arrow: str, target: str, attrs: Optional[str]) -> RelationshipModel:
+        attributes: Dict[str, str] = {}
+        for part in self._split_params(attrs or ""):
+            key, _, value = part.partition(":")
+            attributes[key.strip()] = value.strip().strip("\"'")
+        return RelationshipModel(source, target, ARROWS[arrow], attributes)
+
+    def _attach(self, events: List[Tuple[int, Union[ClassModel, RelationshipModel]]]) -> List[ClassModel]:
+        classes: List[ClassModel] = []
+        by_qualified_name: Dict[str, ClassModel] = {}
+        by_name: Dict[str, List[Tuple[int, ClassModel]]] = {}
+        declared = set()
+        for file_id, event in events:
+            if not isinstance(event, ClassModel):
+                continue
+            qualified = f"{event.package}.{event.name}" if event.package else event.name
+            if (event.package, event.name) in declared:
+                raise ValueError(f"class {qualified} is declared more than once")
+            declared.add((event.package, event.name))
+            if event.package:
+                by_qualified_name[qualified] = event
+            by_name.setdefault(event.name, []).append((file_id, event))
+            classes.append(event)
+
+        def resolve_source(name: str, file_id: int) -> Optional[ClassModel]:
+            # Qualified names match exactly; a simple name prefers a class declared in the
+            # same file, then the only class with that name. Ambiguous names stay unresolved.
+            if name in by_qualified_name:
+                return by_qualified_name[name]
+            candidates = by_name.get(name, [])
+            local = [cls for f, cls in candidates if f == file_id]
+            if len(local) == 1:
+                return local[0]
+            return candidates[0][1] if len(candidates) == 1 else None
+
+        self.unresolved = []
+        for file_id, rel in events:
+            if isinstance(rel, ClassModel):
+                continue
+            source = resolve_source(rel.source, file_id)
+            if source is None:
+                self.unresolved.append(rel)
+                continue
+            # The model refers to other classes by simple name, whether or not they are declared
+            target = rel.target.rsplit(".", 1)[1] if _QUALIFIED_RE.match(rel.target) else rel.target
+            if rel.kind == "extends":
+                source.extends = target
+            elif rel.kind == "implements":
+                source.implements.append(target)
+            elif rel.kind == "association":
+                source.associations.append(target)
+            elif rel.kind == "aggregation":
+                source.aggregations.append(target)
+            elif rel.kind == "composition":
+                source.compositions.append(target)
+            else:
+                source.dependencies.append(target)
+        return classes
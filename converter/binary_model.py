@@ -0,0 +1,207 @@
+import gc
+import mmap
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+from .models import ClassModel, FieldModel, MethodModel
+
+# Aetheris Model Binary (.amb) layout, all integers little-endian:
+#
+#   header      magic, version, flags, string count, namespace count, blob offset, directory offset
+#   blob        NUL-separated UTF-8 of every distinct string (names, types, visibilities, packages)
+#   directory   per namespace: string ref, block offset (u64), block length in words, class count
+#   blocks      one u32 array per namespace holding its class records
+#
+# Strings are referenced as index + 1 so that 0 can encode None. A class record is:
+#   name, type, visibility, flags (1 = abstract), extends,
+#   field count, (name, type, visibility, static) per field,
+#   method count, (name, return type, visibility, static, param count, params...) per method,
+#   then count + refs for implements, associations, dependencies, aggregations, compositions.
+
+MAGIC = b"AMB1"
+VERSION = 1
+_HEADER = struct.Struct("<4sHHIIQQ")
+_DIR_ENTRY = struct.Struct("<IQII")
+
+assert array("I").itemsize == 4
+
+
+def _words(data) -> List[int]:
+    values = array("I")
+    values.frombytes(data)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values.tolist()
+
+
+def _pack_words(values: List[int]) -> bytes:
+    words = array("I", values)
+    if sys.byteorder == "big":
+        words.byteswap()
+    return words.tobytes()
+
+
+class BinaryModelWriter:
+    """
+    Serializes ClassModel objects into the compact .amb format.
+    Every string is stored once in a shared table and classes are grouped into
+    per-namespace blocks so readers can decode a single namespace on its own.
+    """
+
+    def __init__(self):
+        self._strings: Dict[str, int] = {}
+
+    def _ref(self, value: Optional[str]) -> int:
+        if value is None:
+            return 0
+        ref = self._strings.get(value)
+        if ref is None:
+            ref = self._strings[value] = len(self._strings) + 1
+        return ref
+
+    def _encode_class(self, cls: ClassModel, out: List[int]):
+        ref = self._ref
+        out += (ref(cls.name), ref(cls.type), ref(cls.visibility), int(cls.is_abstract), ref(cls.extends))
+        out.append(len(cls.fields))
+        for f in cls.fields:
+            out += (ref(f.name), ref(f.type), ref(f.visibility), int(f.static))
+        out.append(len(cls.methods))
+        for m in cls.methods:
+            out += (ref(m.name), ref(m.return_type), ref(m.visibility), int(m.static), len(m.parameters))
+            out += map(ref, m.parameters)
+        for refs in (cls.implements, cls.associations, cls.dependencies, cls.aggregations, cls.compositions):
+            out.append(len(refs))
+            out += map(ref, refs)
+
+    def encode(self, classes: List[ClassModel]) -> bytes:
+        self._strings = {}
+        namespaces: Dict[Optional[str], List[ClassModel]] = {}
+        for cls in classes:
+            namespaces.setdefault(cls.package, []).append(cls)
+
+        blocks = []
+        for ns, ns_classes in namespaces.items():
+            words: List[int] = []
+            for cls in ns_classes:
+                self._encode_class(cls, words)
+            blocks.append((self._ref(ns), len(ns_classes), _pack_words(words)))
+
+        blob = "\0".join(self._strings).encode("utf-8")
+        blob += b"\0" * (-len(blob) % 4)
+
+        blob_offset = _HEADER.size
+        dir_offset = blob_offset + len(blob)
+        block_offset = dir_offset + _DIR_ENTRY.size * len(blocks)
+
+        directory = []
+        for ns_ref, count, data in blocks:
+            directory.append(_DIR_ENTRY.pack(ns_ref, block_offset, len(data) // 4, count))
+            block_offset += len(data)
+
+        header = _HEADER.pack(MAGIC, VERSION, 0, len(self._strings), len(blocks), blob_offset, dir_offset)
+        return b"".join([header, blob, *directory, *(data for _, _, data in blocks)])
+
+    def write(self, classes: List[ClassModel], path: Path):
+        Path(path).write_bytes(self.encode(classes))
+
+
+class BinaryModelReader:
+    """
+    Memory-maps an .amb file and decodes classes lazily, one namespace block at a time.
+    Only the string table and the namespace directory are read up front.
+    """
+
+    def __init__(self, path: Path):
+        self._file = open(path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, _, n_strings, n_namespaces, blob_offset, dir_offset = _HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"{path} is not an Aetheris binary model (version {VERSION})")
+
+        # Index 0 stands for None, matching the +1 string refs
+        blob = self._map[blob_offset:dir_offset].decode("utf-8")
+        self._strings: List[Optional[str]] = [None] + blob.split("\0")[:n_strings]
+
+        self._blocks: Dict[Optional[str], tuple] = {}
+        for i in range(n_namespaces):
+            ns_ref, offset, length, count = _DIR_ENTRY.unpack_from(self._map, dir_offset + i * _DIR_ENTRY.size)
+            self._blocks[self._strings[ns_ref]] = (offset, length, count)
+
+    def __enter__(self) -> "BinaryModelReader":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self._map.close()
+        self._file.close()
+
+    def namespaces(self) -> List[Optional[str]]:
+        """Returns the namespaces stored in the file (None for classes without a package)."""
+        return list(self._blocks)
+
+    def __len__(self) -> int:
+        return sum(count for _, _, count in self._blocks.values())
+
+    def classes(self, namespace: Optional[str] = None) -> List[ClassModel]:
+        """Decodes the classes of one namespace, or of all namespaces when none is given."""
+        # Decoding only allocates acyclic objects, so pausing the cyclic GC avoids
+        # repeated collections over the growing model.
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            if namespace is not None:
+                return list(self._decode_block(namespace))
+            return [cls for ns in self._blocks for cls in self._decode_block(ns)]
+        finally:
+            if gc_enabled:
+                gc.enable()
+
+    def _decode_block(self, namespace: Optional[str]) -> Iterator[ClassModel]:
+        if namespace not in self._blocks:
+            return
+        offset, length, count = self._blocks[namespace]
+        words = _words(self._map[offset:offset + 4 * length])
+        s = self._strings
+        pos = 0
+        for _ in range(count):
+            name, type_, vis, flags, extends, n_fields = words[pos:pos + 6]
+            pos += 6
+            fields = []
+            for _ in range(n_fields):
+                f_name, f_type, f_vis, f_static = words[pos:pos + 4]
+                fields.append(FieldModel(s[f_name], s[f_type], s[f_vis], bool(f_static)))
+                pos += 4
+            methods = []
+            n_methods = words[pos]
+            pos += 1
+            for _ in range(n_methods):
+                m_name, m_ret, m_vis, m_static, n_params = words[pos:pos + 5]
+                pos += 5
+                params = [s[p] for p in words[pos:pos + n_params]]
+                pos += n_params
+                methods.append(MethodModel(s[m_name], s[m_ret], params, s[m_vis], bool(m_static)))
+            lists = []
+            for _ in range(5):
+                n = words[pos]
+                lists.append([s[r] for r in words[pos + 1:pos + 1 + n]])
+                pos += 1 + n
+            yield ClassModel(
+                name=s[name],
+                type=s[type_],
+                visibility=s[vis],
+                fields=fields,
+                methods=methods,
+                extends=s[extends],
+                implements=lists[0],
+                is_abstract=bool(flags & 1),
+                package=namespace,
+                associations=lists[1],
+                dependencies=lists[2],
+                aggregations=lists[3],
+                compositions=lists[4],
+            )
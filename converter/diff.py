@@ -0,0 +1,152 @@
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+from .graph import iter_relations
+from .models import ClassModel
+from .piml_generator import PIMLGenerator
+
+# Class header colours used by the PIML delta diagram
+DELTA_COLORS = {"added": "#palegreen", "removed": "#pink", "changed": "#lightyellow"}
+
+
+@dataclass
+class Change:
+    kind: str  # attribute, field, method, relationship
+    name: str
+    status: str  # added, removed, changed
+    old: Optional[str] = None
+    new: Optional[str] = None
+
+
+@dataclass
+class ClassDiff:
+    name: str
+    package: Optional[str]
+    status: str  # added, removed, changed
+    changes: List[Change] = field(default_factory=list)
+
+
+@dataclass
+class ModelDiff:
+    classes: List[ClassDiff] = field(default_factory=list)
+    unchanged: int = 0
+
+    def by_status(self, status: str) -> List[ClassDiff]:
+        return [c for c in self.classes if c.status == status]
+
+
+class ModelDiffer:
+    """
+    Compares two models class by class. Classes are matched by package and name;
+    classes with equal fingerprints are skipped, and only the remaining ones are
+    compared attribute by attribute, member by member and relationship by relationship.
+    """
+
+    def diff(self, old: List[ClassModel], new: List[ClassModel]) -> ModelDiff:
+        old_index = {self._key(c): c for c in old}
+        new_index = {self._key(c): c for c in new}
+
+        result = ModelDiff()
+        for key, cls in new_index.items():
+            before = old_index.get(key)
+            if before is None:
+                result.classes.append(ClassDiff(cls.name, cls.package, "added"))
+            elif before.fingerprint() == cls.fingerprint():
+                result.unchanged += 1
+            else:
+                changes = self.compare(before, cls)
+                if changes:
+                    result.classes.append(ClassDiff(cls.name, cls.package, "changed", changes))
+                else:
+                    # Only ordering or duplicate entries differ
+                    result.unchanged += 1
+        for key, cls in old_index.items():
+            if key not in new_index:
+                result.classes.append(ClassDiff(cls.name, cls.package, "removed"))
+
+        result.classes.sort(key=lambda c: (c.package or "", c.name))
+        return result
+
+    def compare(self, old: ClassModel, new: ClassModel) -> List[Change]:
+        changes = []
+        for attr in ("type", "visibility", "is_abstract"):
+            before, after = getattr(old, attr), getattr(new, attr)
+            if attr == "visibility" and (before is None or after is None):
+                # Unknown in one of the models (e.g. read from AML), so not comparable
+                continue
+            if before != after:
+                changes.append(Change("attribute", attr, "changed", str(before), str(after)))
+        changes.extend(self._compare_members("field", self._fields(old), self._fields(new)))
+        changes.extend(self._compare_members("method", self._methods(old), self._methods(new)))
+
+        old_rels = {f"{kind} {target}" for kind, target in iter_relations(old)}
+        new_rels = {f"{kind} {target}" for kind, target in iter_relations(new)}
+        for rel in sorted(new_rels - old_rels):
+            changes.append(Change("relationship", rel, "added", new=rel))
+        for rel in sorted(old_rels - new_rels):
+            changes.append(Change("relationship", rel, "removed", old=rel))
+        return changes
+
+    def _key(self, cls: ClassModel) -> Tuple[str, str]:
+        return cls.package or "", cls.name
+
+    def _fields(self, cls: ClassModel) -> Dict[str, str]:
+        return {f.name: f"{f.type} [{f.visibility}]{' static' if f.static else ''}" for f in cls.fields}
+
+    def _methods(self, cls: ClassModel) -> Dict[str, str]:
+        # Keyed by signature so overloads are compared separately
+        return {
+            f"{m.name}({', '.join(m.parameters)})": f"{m.return_type} [{m.visibility}]{' static' if m.static else ''}"
+            for m in cls.methods
+        }
+
+    def _compare_members(self, kind: str, old: Dict[str, str], new: Dict[str, str]) -> List[Change]:
+        changes = []
+        for name, value in new.items():
+            if name not in old:
+                changes.append(Change(kind, name, "added", new=value))
+            elif old[name] != value:
+                changes.append(Change(kind, name, "changed", old[name], value))
+        for name, value in old.items():
+            if name not in new:
+                changes.append(Change(kind, name, "removed", old=value))
+        return changes
+
+
+def diff_to_markdown(diff: ModelDiff) -> str:
+    """Renders a diff as a Markdown summary suitable for a pull request comment."""
+    counts = {status: len(diff.by_status(status)) for status in ("added", "removed", "changed")}
+    lines = ["## Architecture changes", ""]
+    lines.append(f"{counts['added']} added, {counts['removed']} removed, {counts['changed']} changed, "
+                 f"{diff.unchanged} unchanged classes")
+    symbols = {"added": "+", "removed": "-", "changed": "~"}
+    for status in ("added", "removed", "changed"):
+        classes = diff.by_status(status)
+        if not classes:
+            continue
+        lines.append("")
+        lines.append(f"### {status.capitalize()}")
+        for cls in classes:
+            qualified = f"{cls.package}.{cls.name}" if cls.package else cls.name
+            lines.append(f"- `{qualified}`")
+            for change in cls.changes:
+                symbol = symbols[change.status]
+                if change.kind == "relationship":
+                    lines.append(f"  - {symbol} relationship `{change.name}`")
+                elif change.status == "changed":
+                    lines.append(f"  - {symbol} {change.kind} `{change.name}`: `{change.old}` → `{change.new}`")
+                else:
+                    value = change.new if change.status == "added" else change.old
+                    lines.append(f"  - {symbol} {change.kind} `{change.name}`: `{value}`")
+    return "\n".join(lines) + "\n"
+
+
+def diff_to_piml(diff: ModelDiff, old: List[ClassModel], new: List[ClassModel], title: Optional[str] = None) -> str:
+    """Renders the added, removed and changed classes as a PIML diagram coloured by status."""
+    status = {(c.package, c.name): c.status for c in diff.classes}
+    classes, colors = [], {}
+    for cls in new + [c for c in old if status.get((c.package, c.name)) == "removed"]:
+        key = (cls.package, cls.name)
+        if key in status:
+            classes.append(cls)
+            colors[key] = DELTA_COLORS[status[key]]
+    return PIMLGenerator().generate(classes, title=title, colors=colors)
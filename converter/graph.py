@@ -0,0 +1,188 @@
+from collections import deque
+from dataclasses import replace
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from .models import ClassModel
+
+# Relationship kinds in the order the generators render them.
+RELATION_KINDS = ("extends", "implements", "association", "aggregation", "composition", "dependency")
+
+# Node name used for classes without a package in the package-level graph
+DEFAULT_PACKAGE = "_default"
+
+
+def iter_relations(cls: ClassModel) -> Iterator[Tuple[str, str]]:
+    """
+    Yields (kind, target) pairs for every relationship a class declares.
+    Applies the same rules as the generators: self-references are dropped and
+    dependencies already covered by an association/aggregation/composition are skipped.
+    """
+    if cls.extends:
+        yield "extends", cls.extends
+    for imp in cls.implements:
+        yield "implements", imp
+    for kind, targets in (("association", cls.associations),
+                          ("aggregation", cls.aggregations),
+                          ("composition", cls.compositions)):
+        for target in dict.fromkeys(targets):
+            if target != cls.name:
+                yield kind, target
+    ignore_types = set(cls.associations) | set(cls.aggregations) | set(cls.compositions)
+    for dep in dict.fromkeys(cls.dependencies):
+        if dep != cls.name and dep not in ignore_types:
+            yield "dependency", dep
+
+
+def retain_relationships(cls: ClassModel, keep: Callable[[str], bool]) -> ClassModel:
+    """Returns a copy of the class whose relationships only point at targets accepted by `keep`."""
+    return replace(
+        cls,
+        extends=cls.extends if cls.extends and keep(cls.extends) else None,
+        implements=[t for t in cls.implements if keep(t)],
+        associations=[t for t in cls.associations if keep(t)],
+        dependencies=[t for t in cls.dependencies if keep(t)],
+        aggregations=[t for t in cls.aggregations if keep(t)],
+        compositions=[t for t in cls.compositions if keep(t)],
+    )
+
+
+class RelationshipGraph:
+    """
+    Integer-indexed view of the relationships between a list of ClassModel objects.
+    Node ids are positions in `classes`. Relationship targets are resolved with
+    `resolve_target`; targets that are not part of the model (library types) or are
+    ambiguous are ignored.
+    """
+
+    def __init__(self, classes: Iterable[ClassModel]):
+        self.classes: List[ClassModel] = list(classes)
+        self.ids_by_name: Dict[str, List[int]] = {}
+        self.ids_by_qualified_name: Dict[str, int] = {}
+        for i, cls in enumerate(self.classes):
+            self.ids_by_name.setdefault(cls.name, []).append(i)
+            if cls.package:
+                self.ids_by_qualified_name.setdefault(f"{cls.package}.{cls.name}", i)
+
+        # Edge list as parallel arrays: source id, target id, index into RELATION_KINDS.
+        self.sources: List[int] = []
+        self.targets: List[int] = []
+        self.kinds: List[int] = []
+        kind_ids = {kind: k for k, kind in enumerate(RELATION_KINDS)}
+        for i, cls in enumerate(self.classes):
+            for kind, target in iter_relations(cls):
+                j = self.resolve_target(i, target)
+                if j is not None and j != i:
+                    self.sources.append(i)
+                    self.targets.append(j)
+                    self.kinds.append(kind_ids[kind])
+
+    def __len__(self) -> int:
+        return len(self.classes)
+
+    def resolve_target(self, source: int, target: str) -> Optional[int]:
+        """
+        Resolves a relationship target declared by class `source` to a node id.
+        Fully qualified names match exactly. The parsers record simple names, so a
+        simple name resolves to the class with that name in the source's own package,
+        or else to the only class in the model with that name. Names shared by several
+        classes in other packages are ambiguous and, like library types, return None.
+        """
+        if target in self.ids_by_qualified_name:
+            return self.ids_by_qualified_name[target]
+        candidates = self.ids_by_name.get(target)
+        if not candidates:
+            return None
+        package = self.classes[source].package
+        for j in candidates:
+            if self.classes[j].package == package:
+                return j
+        return candidates[0] if len(candidates) == 1 else None
+
+    def resolve(self, target: str) -> List[int]:
+        """
+        Resolves a focus target to node ids. `target` may be a simple class name,
+        a fully qualified class name or a namespace (which includes its sub-namespaces).
+        """
+        if target in self.ids_by_name:
+            return list(self.ids_by_name[target])
+        ids = []
+        prefix = target + "."
+        for i, cls in enumerate(self.classes):
+            pkg = cls.package or ""
+            if pkg == target or pkg.startswith(prefix) or f"{pkg}.{cls.name}" == target:
+                ids.append(i)
+        return ids
+
+    def neighbours(self, kinds: Optional[Iterable[str]] = None) -> List[List[int]]:
+        """Builds an undirected adjacency list restricted to the given relationship kinds."""
+        allowed = {RELATION_KINDS.index(k) for k in (kinds or RELATION_KINDS)}
+        adjacency: List[List[int]] = [[] for _ in self.classes]
+        for src, dst, kind in zip(self.sources, self.targets, self.kinds):
+            if kind in allowed:
+                adjacency[src].append(dst)
+                adjacency[dst].append(src)
+        return adjacency
+
+    def focus(self, target: str, depth: int = 1, kinds: Optional[Iterable[str]] = None) -> List[ClassModel]:
+        """
+        Extracts the neighbourhood of `target` up to `depth` hops (in either direction)
+        using a breadth-first search. Relationships pointing at model classes outside
+        the neighbourhood are pruned so the generators only draw the subgraph.
+
+        Raises:
+            KeyError: If the target matches no class or namespace.
+        """
+        seeds = self.resolve(target)
+        if not seeds:
+            raise KeyError(target)
+
+        adjacency = self.neighbours(kinds)
+        distance = {i: 0 for i in seeds}
+        queue = deque(seeds)
+        while queue:
+            node = queue.popleft()
+            if distance[node] >= depth:
+                continue
+            for other in adjacency[node]:
+                if other not in distance:
+                    distance[other] = distance[node] + 1
+                    queue.append(other)
+
+        selected = sorted(distance)
+        result = []
+        for i in selected:
+
+            def keep(name: str) -> bool:
+                # Keep edges inside the neighbourhood and references to library types
+                j = self.resolve_target(i, name)
+                if j is None:
+                    return name not in self.ids_by_name and name not in self.ids_by_qualified_name
+                return j in distance
+
+            result.append(retain_relationships(self.classes[i], keep))
+        return result
+
+    def package_graph(self) -> Dict[str, list]:
+        """
+        Aggregates the class graph to one node per namespace. Each edge carries the number
+        of class-level relationships between two packages, in total and per kind.
+        """
+        sizes: Dict[str, int] = {}
+        for cls in self.classes:
+            pkg = cls.package or DEFAULT_PACKAGE
+            sizes[pkg] = sizes.get(pkg, 0) + 1
+
+        weights: Dict[Tuple[str, str], Dict[str, int]] = {}
+        for src, dst, kind in zip(self.sources, self.targets, self.kinds):
+            a = self.classes[src].package or DEFAULT_PACKAGE
+            b = self.classes[dst].package or DEFAULT_PACKAGE
+            if a != b:
+                per_kind = weights.setdefault((a, b), {})
+                per_kind[RELATION_KINDS[kind]] = per_kind.get(RELATION_KINDS[kind], 0) + 1
+
+        return {
+            "packages": [{"name": name, "classes": count} for name, count in sorted(sizes.items())],
+            "edges": [
+                {"source": a, "target": b, "weight": sum(per_kind.values()), "kinds": per_kind}
+                for (a, b), per_kind in sorted(weights.items())
+            ],
+        }
@@ -0,0 +1,26 @@
+import json
+from pathlib import Path
+from typing import List
+from .aml_parser import AMLParser
+from .binary_model import BinaryModelReader
+from .models import ClassModel
+
+
+def load_classes(path: Path) -> List[ClassModel]:
+    """
+    Loads a previously exported model without re-parsing any sources.
+    Supports the JSON (`-f json`), binary (`-f binary`) and AML model formats;
+    a directory is read as one model made of all the .aml files below it.
+    """
+    path = Path(path)
+    if path.is_dir():
+        return AMLParser().read_files(sorted(path.rglob("*.aml")))
+    if path.suffix.lower() == ".amb":
+        with BinaryModelReader(path) as reader:
+            return reader.classes()
+    if path.suffix.lower() == ".json":
+        with open(path, "r", encoding="utf-8") as f:
+            return [ClassModel.from_dict(c) for c in json.load(f)]
+    if path.suffix.lower() == ".aml":
+        return AMLParser().read_file(path)
+    raise ValueError(f"Unsupported model file: {path} (expected .json, .amb or .aml)")
@@ -0,0 +1,218 @@
+import csv
+import io
+from array import array
+from collections import Counter
+from dataclasses import dataclass, field
+from itertools import accumulate
+from typing import List, Optional, Sequence, Tuple
+from .graph import RELATION_KINDS, RelationshipGraph
+from .models import ClassModel
+
+
+@dataclass
+class ClassMetrics:
+    name: str
+    package: Optional[str]
+    fan_in: int = 0
+    fan_out: int = 0
+    depth_of_inheritance: int = 0
+    component: int = 0  # id of the strongly connected component the class belongs to
+
+
+@dataclass
+class PackageMetrics:
+    name: Optional[str]
+    classes: int = 0
+    afferent: int = 0  # Ca: classes outside the package that depend on it
+    efferent: int = 0  # Ce: classes outside the package it depends on
+    instability: float = 0.0  # Ce / (Ca + Ce)
+    in_cycle: bool = False
+
+
+@dataclass
+class ArchitectureMetrics:
+    classes: List[ClassMetrics] = field(default_factory=list)
+    packages: List[PackageMetrics] = field(default_factory=list)
+    class_cycles: List[List[str]] = field(default_factory=list)
+    package_cycles: List[List[Optional[str]]] = field(default_factory=list)
+
+
+def build_csr(n: int, sources: Sequence[int], targets: Sequence[int]) -> Tuple[array, array]:
+    """
+    Builds a compressed sparse row adjacency (offsets, targets) from an edge list,
+    dropping duplicate edges. Neighbours of node v are targets[offsets[v]:offsets[v + 1]].
+    """
+    keys = sorted({s * n + t for s, t in zip(sources, targets)})
+    degree = Counter(key // n for key in keys)
+    offsets = array("q", accumulate((degree.get(v, 0) for v in range(n)), initial=0))
+    return offsets, array("q", [key % n for key in keys])
+
+
+def strongly_connected_components(n: int, offsets: Sequence[int], targets: Sequence[int]) -> Tuple[List[int], int]:
+    """
+    Iterative Tarjan's algorithm over a CSR graph, safe for arbitrarily deep graphs.
+    Returns the component id of every node and the number of components.
+    """
+    index = [-1] * n
+    low = [0] * n
+    on_stack = [False] * n
+    component = [-1] * n
+    stack: List[int] = []
+    counter = 0
+    n_components = 0
+
+    for root in range(n):
+        if index[root] != -1:
+            continue
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = True
+        work = [(root, offsets[root])]
+        while work:
+            v, pos = work[-1]
+            end = offsets[v + 1]
+            while pos < end:
+                w = targets[pos]
+                pos += 1
+                if index[w] == -1:
+                    # Descend into w, remembering where to resume v's neighbours
+                    work[-1] = (v, pos)
+                    index[w] = low[w] = counter
+                    counter += 1
+                    stack.append(w)
+                    on_stack[w] = True
+                    work.append((w, offsets[w]))
+                    break
+                if on_stack[w] and index[w] < low[v]:
+                    low[v] = index[w]
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    if low[v] < low[parent]:
+                        low[parent] = low[v]
+                if low[v] == index[v]:
+                    while True:
+                        w = stack.pop()
+                        on_stack[w] = False
+                        component[w] = n_components
+                        if w == v:
+                            break
+                    n_components += 1
+    return component, n_components
+
+
+class MetricsEngine:
+    """
+    Computes class- and package-level architecture metrics from the relationships
+    carried by ClassModel objects: fan-in/fan-out, strongly connected components
+    (cycles), depth of inheritance and Martin's instability per namespace.
+    """
+
+    def compute(self, classes: List[ClassModel]) -> ArchitectureMetrics:
+        graph = RelationshipGraph(classes)
+        n = len(graph)
+        offsets, targets = build_csr(n, graph.sources, graph.targets)
+
+        fan_in = Counter(targets)
+        component, _ = strongly_connected_components(n, offsets, targets)
+        dit = self._depth_of_inheritance(graph)
+
+        result = ArchitectureMetrics()
+        for i, cls in enumerate(graph.classes):
+            result.classes.append(ClassMetrics(
+                name=cls.name,
+                package=cls.package,
+                fan_in=fan_in[i],
+                fan_out=offsets[i + 1] - offsets[i],
+                depth_of_inheritance=dit[i],
+                component=component[i],
+            ))
+        result.class_cycles = self._cycles(component, [self._qualified(c) for c in graph.classes])
+        self._package_metrics(graph, result)
+        return result
+
+    def _qualified(self, cls: ClassModel) -> str:
+        return f"{cls.package}.{cls.name}" if cls.package else cls.name
+
+    def _cycles(self, component: List[int], labels: list) -> list:
+        members = {}
+        for i, c in enumerate(component):
+            members.setdefault(c, []).append(labels[i])
+        return [sorted(m, key=str) for m in members.values() if len(m) > 1]
+
+    def _depth_of_inheritance(self, graph: RelationshipGraph) -> List[int]:
+        extends_kind = RELATION_KINDS.index("extends")
+        parent = [-1] * len(graph)
+        for s, t, k in zip(graph.sources, graph.targets, graph.kinds):
+            if k == extends_kind and parent[s] == -1:
+                parent[s] = t
+
+        depth = [-1] * len(graph)
+        for start in range(len(graph)):
+            # Walk up to the first class with a known depth, then unwind the path
+            path = []
+            on_path = set()
+            v = start
+            while v != -1 and depth[v] == -1 and v not in on_path:
+                path.append(v)
+                on_path.add(v)
+                v = parent[v]
+            base = depth[v] if v != -1 and depth[v] != -1 else 0
+            for node in reversed(path):
+                cls = graph.classes[node]
+                if parent[node] == -1:
+                    # Superclasses outside the model (library types) still count as one level
+                    base = 1 if cls.extends else 0
+                else:
+                    base += 1
+                depth[node] = base
+        return depth
+
+    def _package_metrics(self, graph: RelationshipGraph, result: ArchitectureMetrics):
+        package_ids = {}
+        pkg_of = [package_ids.setdefault(c.package, len(package_ids)) for c in graph.classes]
+        n, p = len(graph), len(package_ids)
+
+        # Distinct (package, outside class) pairs of cross-package edges, encoded as single ints
+        cross = [(pkg_of[v], pkg_of[w], v, w) for v, w in zip(graph.sources, graph.targets) if pkg_of[v] != pkg_of[w]]
+        efferent_counts = Counter(key // n for key in {pv * n + w for pv, _, _, w in cross})
+        afferent_counts = Counter(key // n for key in {pw * n + v for _, pw, v, _ in cross})
+        efferent = [efferent_counts.get(i, 0) for i in range(p)]
+        afferent = [afferent_counts.get(i, 0) for i in range(p)]
+        sizes = Counter(pkg_of)
+        package_sources = [pv for pv, _, _, _ in cross]
+        package_targets = [pw for _, pw, _, _ in cross]
+
+        pkg_offsets, pkg_targets = build_csr(p, package_sources, package_targets)
+        pkg_component, _ = strongly_connected_components(p, pkg_offsets, pkg_targets)
+        names = list(package_ids)
+        result.package_cycles = self._cycles(pkg_component, names)
+        cyclic = {name for cycle in result.package_cycles for name in cycle}
+
+        for name, i in package_ids.items():
+            coupling = afferent[i] + efferent[i]
+            result.packages.append(PackageMetrics(
+                name=name,
+                classes=sizes[i],
+                afferent=afferent[i],
+                efferent=efferent[i],
+                instability=round(efferent[i] / coupling, 4) if coupling else 0.0,
+                in_cycle=name in cyclic,
+            ))
+
+
+def metrics_to_csv(metrics: ArchitectureMetrics) -> str:
+    """Flattens class and package metrics into one CSV table with a `scope` column."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(["scope", "name", "package", "fan_in", "fan_out", "depth_of_inheritance", "component",
+                     "classes", "afferent", "efferent", "instability", "in_cycle"])
+    for c in metrics.classes:
+        writer.writerow(["class", c.name, c.package or "", c.fan_in, c.fan_out, c.depth_of_inheritance,
+                         c.component, "", "", "", "", ""])
+    for p in metrics.packages:
+        writer.writerow(["package", p.name or "", "", "", "", "", "", p.classes, p.afferent, p.efferent,
+                         p.instability, p.in_cycle])
+    return buffer.getvalue()
@@ -1,5 +1,6 @@
+import hashlib
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 @dataclass
 class FieldModel:
@@ -16,11 +17,18 @@ class MethodModel:
     visibility: str = "+"
     static: bool = False
 
+@dataclass
+class RelationshipModel:
+    source: str
+    target: str
+    kind: str  # extends, implements, association, aggregation, composition, dependency
+    attributes: Dict[str, str] = field(default_factory=dict)
+
 @dataclass
 class ClassModel:
     name: str
     type: str  # class, interface, enum, annotation
-    visibility: str = "+"
+    visibility: Optional[str] = "+"  # None when the source format does not record it (AML)
     fields: List[FieldModel] = field(default_factory=list)
     methods: List[MethodModel] = field(default_factory=list)
     extends: Optional[str] = None
@@ -31,3 +39,22 @@ class ClassModel:
     dependencies: List[str] = field(default_factory=list)
     aggregations: List[str] = field(default_factory=list)
     compositions: List[str] = field(default_factory=list)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ClassModel":
+        """Rebuilds a ClassModel from its `dataclasses.asdict` form (e.g. the JSON model)."""
+        data = dict(data)
+        data["fields"] = [FieldModel(**f) for f in data.get("fields", [])]
+        data["methods"] = [MethodModel(**m) for m in data.get("methods", [])]
+        return cls(**data)
+
+    def fingerprint(self) -> str:
+        """Stable content hash of the class; equal fingerprints mean structurally identical classes."""
+        # repr of plain tuples is deterministic and much cheaper than asdict + json
+        canonical = repr((
+            self.name, self.type, self.visibility, self.extends, self.implements, self.is_abstract,
+            self.package, self.associations, self.dependencies, self.aggregations, self.compositions,
+            [(f.name, f.type, f.visibility, f.static) for f in self.fields],
+            [(m.name, m.return_type, m.parameters, m.visibility, m.static) for m in self.methods],
+        ))
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
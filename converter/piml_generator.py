@@ -1,7 +1,8 @@
 from .models import ClassModel
 
 class PIMLGenerator:
-    def generate(self, classes: list[ClassModel], title: str = None) -> str:
+    def generate(self, classes: list[ClassModel], title: str = None, colors: dict[tuple, str] = None) -> str:
+        # colors: optional header colour per (package, name), e.g. {("app", "User"): "#palegreen"}
         # PIML: Project Infrastructure Modeling Language
         start_tag = f"@startpiml {title}" if title else "@startpiml"
         lines = [start_tag, ""]
@@ -70,6 +71,8 @@ class PIMLGenerator:
             header = f"{cls.type} {cls.name}"
             if cls.is_abstract and cls.type == "class":
                 header = f"abstract class {cls.name}"
+            if colors and (cls.package, cls.name) in colors:
+                header += f" {colors[(cls.package, cls.name)]}"
             
             lines.append(f"    {header} {{")
             for f in cls.fields:
@@ -114,6 +117,13 @@ class PIMLGenerator:
         lines.append("@endpiml")
         return "\n".join(lines)
 
+    def collect_relationships(self, classes: list[ClassModel]) -> list[str]:
+        """Returns the deduplicated, sorted PIML relationship lines declared by the given classes."""
+        rel_lines = []
+        for cls in classes:
+            self._collect_relationships_internal(cls, rel_lines)
+        return sorted(set(rel_lines))
+
     def _collect_relationships_internal(self, cls, rel_lines):
         # Relationships
         if cls.extends:
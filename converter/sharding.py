@@ -0,0 +1,166 @@
+import hashlib
+import json
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Dict, List, Optional
+from .aml_generator import AMLGenerator
+from .graph import RelationshipGraph, retain_relationships
+from .models import ClassModel
+from .piml_generator import PIMLGenerator
+
+DEFAULT_SHARD = "_default"
+INDEX_NAME = "index"
+SHARD_DIR = "shards"  # kept apart from the index so no namespace can overwrite it
+MANIFEST_NAME = ".manifest.json"
+
+
+@dataclass
+class ShardReport:
+    """Outcome of a sharded generation run, as file names relative to the output directory."""
+    written: List[str] = field(default_factory=list)
+    unchanged: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+
+
+def _render_shard(format: str, classes: List[ClassModel], title: Optional[str]) -> str:
+    # Module-level so it can be pickled into worker processes.
+    if format == "aml":
+        return AMLGenerator().generate(classes)
+    return PIMLGenerator().generate(classes, title=title)
+
+
+class ShardedGenerator:
+    """
+    Splits a model into one AML/PIML document per namespace plus an index document
+    holding the relationships that cross shard boundaries. Shards are rendered
+    concurrently and only rewritten when their content hash changes, so downstream
+    PlantUML renders can be limited to the files that actually changed.
+    """
+
+    def __init__(self, format: str = "aml", workers: Optional[int] = None):
+        if format not in ("aml", "piml"):
+            raise ValueError(f"Sharding is not supported for format '{format}'")
+        self.format = format
+        self.workers = workers
+
+    def _split(self, classes: List[ClassModel], cross_shard: bool) -> List[ClassModel]:
+        """
+        Copies every class keeping either the relationships that stay inside its shard
+        or only those that cross into another shard. Targets are resolved like the
+        RelationshipGraph does (same package first); unresolved targets such as library
+        types stay with the class that references them. Cross-shard stubs use fully
+        qualified names so homonyms in different shards stay distinguishable.
+        """
+        graph = RelationshipGraph(classes)
+        result = []
+        for i, cls in enumerate(graph.classes):
+            ns = cls.package or DEFAULT_SHARD
+
+            def keep(name: str) -> bool:
+                j = graph.resolve_target(i, name)
+                crosses = j is not None and (graph.classes[j].package or DEFAULT_SHARD) != ns
+                return crosses == cross_shard
+
+            kept = retain_relationships(cls, keep)
+            if cross_shard:
+                kept = self._qualify(graph, i, kept)
+            result.append(kept)
+        return result
+
+    def _qualify(self, graph: RelationshipGraph, source: int, cls: ClassModel) -> ClassModel:
+        def qualified(name: str) -> str:
+            j = graph.resolve_target(source, name)
+            target = graph.classes[j] if j is not None else None
+            return f"{target.package}.{target.name}" if target and target.package else name
+
+        return replace(
+            cls,
+            name=f"{cls.package}.{cls.name}" if cls.package else cls.name,
+            extends=qualified(cls.extends) if cls.extends else None,
+            implements=[qualified(t) for t in cls.implements],
+            associations=[qualified(t) for t in cls.associations],
+            dependencies=[qualified(t) for t in cls.dependencies],
+            aggregations=[qualified(t) for t in cls.aggregations],
+            compositions=[qualified(t) for t in cls.compositions],
+        )
+
+    def shard(self, classes: List[ClassModel]) -> Dict[str, List[ClassModel]]:
+        """
+        Groups classes by namespace, keeping only relationships that stay inside their shard.
+
+        Raises:
+            ValueError: If a namespace is named like the shard of classes without a package.
+        """
+        packages = {cls.package for cls in classes}
+        if None in packages and DEFAULT_SHARD in packages:
+            raise ValueError(f"Namespace '{DEFAULT_SHARD}' collides with the shard of classes without a package")
+        shards: Dict[str, List[ClassModel]] = {}
+        for cls in self._split(classes, cross_shard=False):
+            shards.setdefault(cls.package or DEFAULT_SHARD, []).append(cls)
+        return dict(sorted(shards.items()))
+
+    def render_index(self, classes: List[ClassModel], shard_files: Dict[str, str], title: Optional[str] = None) -> str:
+        """Renders the index: the shard list and a stub for every cross-shard relationship."""
+        stubs = self._split(classes, cross_shard=True)
+
+        if self.format == "aml":
+            lines = ["// Shards"]
+            lines.extend(f"// {ns}: {name}" for ns, name in shard_files.items())
+            lines.append("")
+            lines.append("// Relationships")
+            lines.extend(sorted(AMLGenerator().collect_relationships(stubs)))
+            return "\n".join(lines)
+
+        lines = [f"@startpiml {title}" if title else "@startpiml", ""]
+        lines.extend(f"' shard {ns}: {name}" for ns, name in shard_files.items())
+        lines.append("")
+        lines.append("' Relationships")
+        lines.extend(PIMLGenerator().collect_relationships(stubs))
+        lines.append("@endpiml")
+        return "\n".join(lines)
+
+    def write(self, classes: List[ClassModel], directory: Path, title: Optional[str] = None) -> ShardReport:
+        """
+        Writes the index into `directory` and the shards into its `shards/` subdirectory,
+        skipping files whose content is unchanged.
+        """
+        directory = Path(directory)
+        shards = self.shard(classes)
+        (directory / SHARD_DIR).mkdir(parents=True, exist_ok=True)
+        shard_files = {ns: f"{SHARD_DIR}/{ns}.{self.format}" for ns in shards}
+
+        if self.workers == 1 or len(shards) <= 1:
+            contents = [_render_shard(self.format, c, ns) for ns, c in shards.items()]
+        else:
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                contents = list(executor.map(_render_shard, [self.format] * len(shards),
+                                             shards.values(), shards.keys()))
+
+        outputs = dict(zip(shard_files.values(), contents))
+        outputs[f"{INDEX_NAME}.{self.format}"] = self.render_index(classes, shard_files, title)
+
+        manifest_path = directory / MANIFEST_NAME
+        previous: Dict[str, str] = {}
+        if manifest_path.exists():
+            previous = json.loads(manifest_path.read_text(encoding="utf-8"))
+
+        report = ShardReport()
+        manifest: Dict[str, str] = {}
+        for name, content in outputs.items():
+            digest = hashlib.sha256(content.encode("utf-8")).hexdigest()
+            manifest[name] = digest
+            target = directory / name
+            if previous.get(name) == digest and target.exists():
+                report.unchanged.append(name)
+                continue
+            target.write_text(content, encoding="utf-8")
+            report.written.append(name)
+
+        # Drop shards of namespaces that no longer exist
+        for name in previous.keys() - manifest.keys():
+            (directory / name).unlink(missing_ok=True)
+            report.removed.append(name)
+
+        manifest_path.write_text(json.dumps(manifest, indent=2, sort_keys=True), encoding="utf-8")
+        return report
@@ -2,33 +2,49 @@ import click
 import os
 from pathlib import Path
 from converter.factory import ParserFactory
+from converter.aml_parser import AMLParser
 from converter.piml_generator import PIMLGenerator
 from converter.aml_generator import AMLGenerator
+from converter.graph import RELATION_KINDS, RelationshipGraph
+from converter.sharding import ShardedGenerator
+from converter.binary_model import BinaryModelWriter
+from converter.metrics import MetricsEngine, metrics_to_csv
+from converter.loader import load_classes
+from converter.diff import ModelDiffer, diff_to_markdown, diff_to_piml
 
-@click.command()
-@click.argument('path', type=click.Path(exists=True))
-@click.option('--output', '-o', default='diagram.aml', help='Output file')
-@click.option('--format', '-f', type=click.Choice(['aml', 'piml', 'json']), default='aml', help='Output format (default: aml)')
-def main(path, output, format):
+class DefaultCommandGroup(click.Group):
+    """
+    Command group that falls back to `convert` when no sub-command is named,
+    so `main.py <path>` keeps working next to `main.py diff old new`.
+    """
+    def parse_args(self, ctx, args):
+        if args and args[0] not in self.commands and args[0] not in ('--help', '-h'):
+            args = ['convert', *args]
+        return super().parse_args(ctx, args)
+
+@click.group(cls=DefaultCommandGroup)
+def cli():
     """
     Aetheris: Convert Java/Kotlin source code to architectural diagrams.
-    PATH can be a file or a directory.
     """
+
+def _parse_sources(path: Path) -> list:
+    """Parses every Java/Kotlin file under PATH with the parser registered for its extension."""
     parser_factory = ParserFactory()
     
     all_classes = []
     supported_extensions = parser_factory.get_supported_extensions()
     
     files_to_process = []
-    if os.path.isfile(path):
-        files_to_process.append(Path(path))
+    if path.is_file():
+        files_to_process.append(path)
     else:
         for ext in supported_extensions:
-            files_to_process.extend(Path(path).rglob(f"*{ext}"))
+            files_to_process.extend(path.rglob(f"*{ext}"))
 
     if not files_to_process:
         click.echo(f"No supported files found (supported: {', '.join(supported_extensions)})")
-        return
+        return []
 
     for file_path in files_to_process:
         parser = parser_factory.get_parser_for_extension(file_path.suffix)
@@ -42,12 +58,102 @@ def main(path, output, format):
             all_classes.extend(parser.parse(content))
         except Exception as e:
             click.echo(f"Failed to parse {file_path}: {e}", err=True)
+    return all_classes
+
+def _read_aml(path: Path, output: Path) -> list:
+    """
+    Reads a .aml file, or every .aml file under a directory, back into one model.
+    The --output file is skipped so re-running a conversion does not read its own result.
+
+    Raises:
+        click.ClickException: If a file is malformed or a class is declared twice.
+    """
+    if path.is_file():
+        files = [path]
+    else:
+        files = sorted(p for p in path.rglob("*.aml") if p.resolve() != output.resolve())
+    if not files:
+        click.echo(f"No .aml files found in {path}")
+        return []
+
+    click.echo(f"Reading {len(files)} AML file(s) from {path}...")
+    parser = AMLParser()
+    try:
+        all_classes = parser.read_files(files)
+    except ValueError as e:
+        raise click.ClickException(str(e))
+    if parser.unresolved:
+        click.echo(f"Skipped {len(parser.unresolved)} relationships whose source class is not declared", err=True)
+    return all_classes
+
+@cli.command('convert')
+@click.argument('path', type=click.Path(exists=True))
+@click.option('--output', '-o', help='Output file (default: diagram.aml, or metrics.<json|csv> with --metrics)')
+@click.option('--input-format', type=click.Choice(['source', 'aml']), default='source', help='Read Java/Kotlin sources or AML diagrams (default: source; a .aml PATH is always read as AML)')
+@click.option('--format', '-f', type=click.Choice(['aml', 'piml', 'json', 'binary']), default='aml', help='Output format (default: aml)')
+@click.option('--focus', help='Only render the neighbourhood of this class or namespace')
+@click.option('--depth', default=1, show_default=True, type=click.IntRange(min=0), help='Number of relationship hops to include around --focus')
+@click.option('--relation', '-r', 'relations', multiple=True, type=click.Choice(RELATION_KINDS), help='Relationship kinds to follow for --focus (repeatable, default: all)')
+@click.option('--shard-by', type=click.Choice(['namespace']), help='Write one file per namespace plus an index into a directory named after --output')
+@click.option('--workers', type=click.IntRange(min=1), help='Worker processes used to render shards (default: CPU count)')
+@click.option('--metrics', type=click.Choice(['json', 'csv']), help='Write architecture metrics (fan-in/out, cycles, inheritance depth, instability) instead of a diagram')
+def main(path, output, input_format, format, focus, depth, relations, shard_by, workers, metrics):
+    """
+    Convert Java/Kotlin source code to architectural diagrams (default command).
+    PATH can be a file or a directory. With --input-format aml (or a .aml PATH)
+    previously generated AML diagrams are read back as the model instead.
+    """
+    ctx = click.get_current_context()
+    if not focus and (relations or ctx.get_parameter_source('depth') != click.core.ParameterSource.DEFAULT):
+        raise click.UsageError("--depth and --relation can only be used with --focus.")
+    if shard_by and format in ('json', 'binary'):
+        raise click.UsageError("--shard-by is only supported for the aml and piml formats.")
+    if metrics:
+        format_given = ctx.get_parameter_source('format') != click.core.ParameterSource.DEFAULT
+        if shard_by or workers or format_given:
+            raise click.UsageError("--metrics cannot be combined with --format, --shard-by or --workers.")
+        output = output or f"metrics.{metrics}"
+    if workers and not shard_by:
+        raise click.UsageError("--workers can only be used with --shard-by.")
+    output = output or 'diagram.aml'
+
+    if input_format == 'aml' or (os.path.isfile(path) and Path(path).suffix.lower() == '.aml'):
+        all_classes = _read_aml(Path(path), Path(output))
+    else:
+        all_classes = _parse_sources(Path(path))
 
     if not all_classes:
         click.echo("No classes extracted.")
         return
 
+    if focus:
+        try:
+            all_classes = RelationshipGraph(all_classes).focus(focus, depth, relations or None)
+        except KeyError:
+            raise click.BadParameter(f"No class or namespace matches '{focus}'.", param_hint="'--focus'")
+        click.echo(f"Focused on {focus} (depth {depth}): {len(all_classes)} classes")
+
     diagram_name = Path(output).stem
+
+    if metrics:
+        import json
+        from dataclasses import asdict
+        result = MetricsEngine().compute(all_classes)
+        content = json.dumps(asdict(result), indent=2) if metrics == 'json' else metrics_to_csv(result)
+        with open(output, 'w', encoding='utf-8', newline='') as f:
+            f.write(content)
+        click.echo(f"Successfully generated {output} (Metrics: {metrics.upper()}, {len(result.class_cycles)} class cycles)")
+        return
+
+    if shard_by:
+        shard_dir = Path(output).with_suffix('')
+        try:
+            report = ShardedGenerator(format, workers).write(all_classes, shard_dir, title=diagram_name)
+        except ValueError as e:
+            raise click.ClickException(str(e))
+        click.echo(f"Successfully generated {shard_dir}/ (Format: {format.upper()}): "
+                   f"{len(report.written)} written, {len(report.unchanged)} unchanged, {len(report.removed)} removed")
+        return
     
     if format == 'aml':
         generator = AMLGenerator()
@@ -56,14 +162,52 @@ def main(path, output, format):
         import json
         from dataclasses import asdict
         content = json.dumps([asdict(c) for c in all_classes], indent=2)
+    elif format == 'binary':
+        content = None
+        BinaryModelWriter().write(all_classes, Path(output))
     else:
         generator = PIMLGenerator()
         content = generator.generate(all_classes, title=diagram_name)
     
-    with open(output, 'w', encoding='utf-8') as f:
-        f.write(content)
+    if content is not None:
+        with open(output, 'w', encoding='utf-8') as f:
+            f.write(content)
     
     click.echo(f"Successfully generated {output} (Format: {format.upper()})")
 
+@cli.command('diff')
+@click.argument('old', type=click.Path(exists=True))
+@click.argument('new', type=click.Path(exists=True))
+@click.option('--output', '-o', help='Output file (default: stdout)')
+@click.option('--format', '-f', type=click.Choice(['markdown', 'json']), default='markdown', help='Report format (default: markdown)')
+@click.option('--diagram', type=click.Path(), help='Also write a coloured PIML delta diagram to this file')
+def diff(old, new, output, format, diagram):
+    """
+    Report classes, members and relationships that changed between two models.
+    OLD and NEW are models exported with -f json, -f binary or -f aml, or
+    directories of AML files (e.g. --shard-by output) read as one model.
+    """
+    old_classes, new_classes = load_classes(Path(old)), load_classes(Path(new))
+    result = ModelDiffer().diff(old_classes, new_classes)
+
+    if format == 'json':
+        import json
+        from dataclasses import asdict
+        content = json.dumps(asdict(result), indent=2)
+    else:
+        content = diff_to_markdown(result)
+
+    if output:
+        with open(output, 'w', encoding='utf-8') as f:
+            f.write(content)
+        click.echo(f"Successfully generated {output} (Format: {format.upper()})")
+    else:
+        click.echo(content)
+
+    if diagram:
+        with open(diagram, 'w', encoding='utf-8') as f:
+            f.write(diff_to_piml(result, old_classes, new_classes, title=Path(diagram).stem))
+        click.echo(f"Successfully generated {diagram} (Format: PIML)")
+
 if __name__ == '__main__':
-    main()
+    cli()
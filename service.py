@@ -1,11 +1,22 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
+from dataclasses import asdict
+from functools import lru_cache
+from typing import List, Optional
 import json
+import logging
 import os
 from pathlib import Path
+from converter.binary_model import BinaryModelReader
+from converter.graph import DEFAULT_PACKAGE, RELATION_KINDS, RelationshipGraph
+from converter.metrics import MetricsEngine
+from converter.diff import ModelDiffer
+from converter.loader import load_classes
+from converter.models import ClassModel
 
 app = FastAPI()
+logger = logging.getLogger("uvicorn.error")
 
 # Enable CORS for the Vite development server
 app.add_middleware(
@@ -18,18 +29,148 @@ app.add_middleware(
 
 PROJECT_ROOT = Path(__file__).parent
 MODEL_PATH = PROJECT_ROOT / "visualizer" / "src" / "assets" / "model.json"
+# Compact binary model (main.py -f binary)
+MODEL_BIN_PATH = PROJECT_ROOT / "visualizer" / "src" / "assets" / "model.amb"
+# AML model, read back without re-parsing sources
+MODEL_AML_PATH = PROJECT_ROOT / "visualizer" / "src" / "assets" / "model.aml"
 LAYOUT_PATH = PROJECT_ROOT / "visualizer" / "src" / "assets" / "layout.json"
 
 class LayoutData(BaseModel):
     positions: dict
 
-@app.get("/api/model")
-async def get_model():
-    if not MODEL_PATH.exists():
+# Request payloads mirroring converter.models; unknown keys are rejected with a 422
+class FieldPayload(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+    name: str
+    type: str
+    visibility: str = "+"
+    static: bool = False
+
+class MethodPayload(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+    name: str
+    return_type: str
+    parameters: List[str] = []
+    visibility: str = "+"
+    static: bool = False
+
+class ClassPayload(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+    name: str
+    type: str
+    visibility: Optional[str] = "+"
+    fields: List[FieldPayload] = []
+    methods: List[MethodPayload] = []
+    extends: Optional[str] = None
+    implements: List[str] = []
+    is_abstract: bool = False
+    package: Optional[str] = None
+    associations: List[str] = []
+    dependencies: List[str] = []
+    aggregations: List[str] = []
+    compositions: List[str] = []
+
+class DiffRequest(BaseModel):
+    old: List[ClassPayload]
+    new: Optional[List[ClassPayload]] = None  # defaults to the current model
+
+_served_model: Optional[Path] = None
+
+def _model_file() -> Path:
+    """Returns the most recently written of model.amb, model.json and model.aml."""
+    global _served_model
+    candidates = [p for p in (MODEL_BIN_PATH, MODEL_PATH, MODEL_AML_PATH) if p.exists()]
+    if not candidates:
         raise HTTPException(status_code=404, detail="Model file not found. Run the converter first.")
+    path = max(candidates, key=lambda p: p.stat().st_mtime_ns)
+    if path != _served_model:
+        logger.info("Serving model from %s", path)
+        _served_model = path
+    return path
+
+def _load_classes(namespace: Optional[str] = None) -> List[ClassModel]:
+    path = _model_file()
+    if path == MODEL_BIN_PATH:
+        with BinaryModelReader(path) as reader:
+            return reader.classes(namespace)
+    classes = load_classes(path)
+    if namespace is not None:
+        classes = [c for c in classes if c.package == namespace]
+    return classes
+
+def _model_version() -> tuple:
+    path = _model_file()
+    stat = path.stat()
+    return str(path), stat.st_mtime_ns, stat.st_size
+
+@lru_cache(maxsize=4)
+def _package_view(version: tuple) -> tuple:
+    # Keyed by model file version so the aggregation only runs once per converter run
+    classes = _load_classes()
+    by_package = {}
+    for cls in classes:
+        by_package.setdefault(cls.package or DEFAULT_PACKAGE, []).append(cls)
+    return RelationshipGraph(classes).package_graph(), by_package
+
+@lru_cache(maxsize=4)
+def _metrics(version: tuple) -> dict:
+    # Same per-version caching as _package_view; computing metrics is the slowest endpoint
+    return asdict(MetricsEngine().compute(_load_classes()))
+
+# Endpoints that load or analyse the model are plain functions so FastAPI runs them
+# in its threadpool instead of blocking the event loop.
+@app.get("/api/model")
+def get_model(namespace: Optional[str] = None):
+    if _model_file() != MODEL_PATH or namespace is not None:
+        return [asdict(c) for c in _load_classes(namespace)]
     with open(MODEL_PATH, "r", encoding="utf-8") as f:
         return json.load(f)
 
+@app.get("/api/model/namespaces")
+def get_model_namespaces():
+    if _model_file() == MODEL_BIN_PATH:
+        with BinaryModelReader(MODEL_BIN_PATH) as reader:
+            return reader.namespaces()
+    return list(dict.fromkeys(c.package for c in _load_classes()))
+
+@app.get("/api/model/focus")
+def get_model_focus(
+    target: str,
+    depth: int = Query(1, ge=0),
+    relation: Optional[List[str]] = Query(None),
+):
+    unknown = set(relation or []) - set(RELATION_KINDS)
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown relation kinds: {', '.join(sorted(unknown))}")
+    try:
+        subgraph = RelationshipGraph(_load_classes()).focus(target, depth, relation)
+    except KeyError:
+        raise HTTPException(status_code=404, detail=f"No class or namespace matches '{target}'.")
+    return [asdict(c) for c in subgraph]
+
+@app.get("/api/metrics")
+def get_metrics():
+    return _metrics(_model_version())
+
+@app.post("/api/diff")
+def diff_models(data: DiffRequest):
+    old = [ClassModel.from_dict(c.model_dump()) for c in data.old]
+    new = [ClassModel.from_dict(c.model_dump()) for c in data.new] if data.new is not None else _load_classes()
+    return asdict(ModelDiffer().diff(old, new))
+
+@app.get("/api/packages")
+def get_packages():
+    version = _model_version()
+    graph, _ = _package_view(version)
+    return {"version": f"{version[1]}-{version[2]}", **graph}
+
+@app.get("/api/packages/{name}")
+def get_package(name: str):
+    _, by_package = _package_view(_model_version())
+    if name not in by_package:
+        raise HTTPException(status_code=404, detail=f"Package '{name}' not found.")
+    return {"name": name, "classes": [asdict(c) for c in by_package[name]]}
+
 @app.get("/api/layout")
 async def get_layout():
     if not LAYOUT_PATH.exists():